@@ -8,19 +8,29 @@ This plugin handles:
 - Photo unpublishing and cleanup
 """
 
-import urllib.request
+import http.client
+import threading
 import urllib.parse
-import urllib.error
 import json
-import hashlib
 import hmac
+import re
+import secrets
 import time
 import uuid
 import base64
 import xml.etree.ElementTree as ET
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, nullcontext
 from fnmatch import fnmatch
 
+# Use orjson when available: it parses bytes directly (no UTF-8 decode
+# step) and is considerably faster than the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from photoserv_plugin import PhotoservPlugin
 
 # Required module-level variables
@@ -30,6 +40,20 @@ __plugin_version__ = "0.3.0"
 __plugin_author__ = "Max Loiacono"
 __plugin_website__ = "https://github.com/photoserv/python-plugins/blob/main/plugins/flickr.md"
 
+# Flickr API endpoints
+_REST_URL = "https://api.flickr.com/services/rest/"
+_UPLOAD_URL = "https://up.flickr.com/services/upload/"
+
+# Upload responses have exactly two tiny shapes (a photoid element or an
+# err element), so targeted regexes cover the common case without
+# invoking the XML parser
+_UPLOAD_STAT_RE = re.compile(rb'stat="(ok|fail)"')
+_UPLOAD_PHOTOID_RE = re.compile(rb'<photoid[^>]*>(\d+)</photoid>')
+_UPLOAD_ERR_RE = re.compile(rb'<err\s+code="([^"]*)"\s+msg="([^"]*)"')
+
+# Valid values for the safety_level entity parameter
+_VALID_SAFETY_LEVELS = frozenset((1, 2, 3))
+
 # Plugin configuration schema
 __plugin_config__ = {
     "flickr_api_key": "Flickr API Key (Consumer Key)",
@@ -72,13 +96,48 @@ class FlickrPlugin(PhotoservPlugin):
             self.logger.error("Missing required Flickr credentials in configuration")
             raise ValueError("flickr_api_key, flickr_api_secret, flickr_oauth_token, flickr_oauth_token_secret, and flickr_user_id are required")
         
+        # Precompute the OAuth signing key (client_secret&token_secret);
+        # the credentials are immutable for the plugin's lifetime
+        self._signing_key_bytes = (
+            f"{urllib.parse.quote(self.api_secret, safe='')}&"
+            f"{urllib.parse.quote(self.oauth_token_secret, safe='')}"
+        ).encode('utf-8')
+
+        # Static OAuth parameters shared by every request; copied into the
+        # per-call dict rather than rebuilt from literals each time
+        self._oauth_static = {
+            'oauth_consumer_key': self.api_key,
+            'oauth_token': self.oauth_token,
+            'oauth_signature_method': 'HMAC-SHA1',
+            'oauth_version': '1.0',
+        }
+
+        # Percent-encoded endpoint URLs for signature base strings; the
+        # endpoints never change, so quote them once instead of per call
+        self._quoted_base_urls = {
+            url: urllib.parse.quote(url, safe='')
+            for url in (_REST_URL, _UPLOAD_URL)
+        }
+
         # Optional configuration
         self.flickr_photo_limit = config.get('flickr_photo_limit', 1000)
         self.flickr_photo_limit_initial_count = config.get('flickr_photo_limit_initial_count', 0)
         self.upload_size = config.get('upload_size', 'original')
         self.photo_description_footer = config.get('photo_description_footer')
         self.group_sets = config.get('group_sets', [])
-        
+
+        # Index group sets for fast lookup during publish. Literal patterns
+        # (no glob metacharacters) are matched via set intersection; only
+        # genuine glob patterns fall back to fnmatch scanning.
+        self._group_sets_by_name = {
+            gs['name']: gs for gs in self.group_sets if gs.get('name')
+        }
+        self._group_set_matchers = []
+        for group_set in self.group_sets:
+            exact_tags, glob_tags = self._split_glob_patterns(group_set.get('auto_tags', []))
+            exact_albums, glob_albums = self._split_glob_patterns(group_set.get('auto_albums', []))
+            self._group_set_matchers.append((exact_tags, glob_tags, exact_albums, glob_albums))
+
         self.logger.info(f"Flickr plugin initialized for user {self.user_id}")
         self.logger.info(f"Max published photos: {self.flickr_photo_limit}")
         self.logger.info(f"Initial photo count: {self.flickr_photo_limit_initial_count}")
@@ -90,6 +149,27 @@ class FlickrPlugin(PhotoservPlugin):
             self.photoserv.config.set('published_photo_count', self.flickr_photo_limit_initial_count)
             self.logger.info(f"Initialized published_photo_count to {self.flickr_photo_limit_initial_count}")
 
+        # Bounded pool for concurrent group adds; kept small to stay
+        # polite with Flickr's per-key rate limits
+        self._group_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='flickr-grp')
+
+        # Keep-alive HTTPS connections per host, reused across API calls
+        # to avoid a fresh TCP+TLS handshake on every request
+        self._conn_pools = {}
+        self._conn_lock = threading.Lock()
+
+    @staticmethod
+    def _split_glob_patterns(patterns):
+        """Partition patterns into a frozenset of literals and a tuple of globs."""
+        exact = []
+        globs = []
+        for pattern in patterns:
+            if any(c in pattern for c in '*?['):
+                globs.append(pattern)
+            else:
+                exact.append(pattern)
+        return frozenset(exact), tuple(globs)
+
     def _flickr_api_call(self, method, params=None, upload=False, photo_data=None):
         """
         Make a Flickr API call with OAuth 1.0a signing.
@@ -110,19 +190,13 @@ class FlickrPlugin(PhotoservPlugin):
             params = {}
         
         # Base URL for API calls
-        if upload:
-            base_url = "https://up.flickr.com/services/upload/"
-        else:
-            base_url = "https://api.flickr.com/services/rest/"
+        base_url = _UPLOAD_URL if upload else _REST_URL
         
         # Add required OAuth parameters
         oauth_params = {
-            'oauth_nonce': hashlib.md5(str(time.time()).encode()).hexdigest(),
+            **self._oauth_static,
+            'oauth_nonce': secrets.token_hex(16),
             'oauth_timestamp': str(int(time.time())),
-            'oauth_consumer_key': self.api_key,
-            'oauth_token': self.oauth_token,
-            'oauth_signature_method': 'HMAC-SHA1',
-            'oauth_version': '1.0',
         }
         
         # Merge with method-specific parameters
@@ -137,95 +211,197 @@ class FlickrPlugin(PhotoservPlugin):
         signature = self._generate_oauth_signature('POST', base_url, all_params)
         all_params['oauth_signature'] = signature
         
+        if upload and photo_data:
+            # Create multipart/form-data for upload
+            boundary = f'----WebKitFormBoundary{uuid.uuid4().hex}'
+            head, footer = self._create_multipart_body(all_params, boundary)
+
+            # Determine photo size without copying the stream contents
+            photo_data.seek(0, 2)
+            photo_size = photo_data.tell()
+
+            headers = {
+                'Content-Type': f'multipart/form-data; boundary={boundary}',
+                'Content-Length': str(len(head) + photo_size + len(footer)),
+            }
+
+            # Stream the body in chunks so the photo is never duplicated
+            # in memory; rebuilt per attempt so a retried request can
+            # replay it from the start
+            def make_body():
+                photo_data.seek(0)
+
+                def body_chunks():
+                    yield head
+                    while True:
+                        chunk = photo_data.read(65536)
+                        if not chunk:
+                            break
+                        yield chunk
+                    yield footer
+
+                return body_chunks()
+        else:
+            # Regular form-encoded POST
+            form_data = urllib.parse.urlencode(all_params).encode('utf-8')
+            headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+            def make_body():
+                return form_data
+
         try:
-            if upload and photo_data:
-                # Create multipart/form-data for upload
-                boundary = f'----WebKitFormBoundary{uuid.uuid4().hex}'
-                body = self._create_multipart_body(all_params, photo_data, boundary)
-                
-                req = urllib.request.Request(
-                    base_url,
-                    data=body,
-                    headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
-                    method='POST'
-                )
-            else:
-                # Regular form-encoded POST
-                data = urllib.parse.urlencode(all_params).encode('utf-8')
-                req = urllib.request.Request(base_url, data=data, method='POST')
-            
-            with urllib.request.urlopen(req, timeout=120) as response:
-                response_data = response.read().decode('utf-8')
-                
-                if upload:
-                    # Upload responses are XML
-                    return self._parse_upload_response(response_data)
-                else:
-                    result = json.loads(response_data)
-                    
-                    if result.get('stat') == 'fail':
-                        error_msg = result.get('message', 'Unknown error')
-                        raise Exception(f"Flickr API error: {error_msg}")
-                    
-                    return result
-                    
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
-            self.logger.error(f"HTTP error calling Flickr API: {e.code} - {error_body}")
-            raise Exception(f"Flickr API HTTP error: {e.code}")
-        except urllib.error.URLError as e:
-            self.logger.error(f"URL error calling Flickr API: {e.reason}")
-            raise Exception(f"Flickr API connection error: {e.reason}")
+            status, response_data = self._http_post(base_url, make_body, headers)
+
+            if status >= 400:
+                error_body = response_data.decode('utf-8', errors='replace')
+                self.logger.error(f"HTTP error calling Flickr API: {status} - {error_body}")
+                raise Exception(f"Flickr API HTTP error: {status}")
+
+            if upload:
+                # Upload responses are XML; ET.fromstring accepts bytes
+                # directly, so skip the decode/re-encode round trip
+                return self._parse_upload_response(response_data)
+
+            result = _json_loads(response_data)
+
+            if result.get('stat') == 'fail':
+                error_msg = result.get('message', 'Unknown error')
+                raise Exception(f"Flickr API error: {error_msg}")
+
+            return result
+
+        except (http.client.HTTPException, OSError) as e:
+            self.logger.error(f"Connection error calling Flickr API: {e}")
+            raise Exception(f"Flickr API connection error: {e}")
         except Exception as e:
             self.logger.error(f"Error calling Flickr API: {str(e)}")
             raise
 
-    def _create_multipart_body(self, params, photo_data, boundary):
+    def _http_post(self, url, make_body, headers):
         """
-        Create multipart/form-data body for photo upload.
-        
+        POST to a Flickr endpoint over a pooled keep-alive connection.
+
+        Args:
+            url: Full endpoint URL
+            make_body: Zero-argument callable returning the request body;
+                called again if a stale pooled connection forces a retry
+            headers: Dictionary of request headers
+
+        Returns:
+            Tuple of (HTTP status code, response body bytes)
+        """
+        parts = urllib.parse.urlsplit(url)
+        conn, reused = self._acquire_connection(parts.netloc)
+        try:
+            try:
+                conn.request('POST', parts.path, body=make_body(), headers=headers)
+                response = conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                # The server may have closed a pooled connection while it
+                # sat idle; retry once on a fresh connection
+                conn.close()
+                if not reused:
+                    raise
+                conn = http.client.HTTPSConnection(parts.netloc, timeout=120)
+                conn.request('POST', parts.path, body=make_body(), headers=headers)
+                response = conn.getresponse()
+
+            body = response.read()
+
+            # Keep the connection for reuse unless the server is closing it
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(parts.netloc, conn)
+
+            return response.status, body
+        except Exception:
+            conn.close()
+            raise
+
+    def _acquire_connection(self, host):
+        """Take an idle keep-alive connection for host, or open a new one."""
+        with self._conn_lock:
+            pool = self._conn_pools.get(host)
+            if pool:
+                return pool.pop(), True
+        return http.client.HTTPSConnection(host, timeout=120), False
+
+    def _release_connection(self, host, conn):
+        """Return a connection to the idle pool, or close it if the pool is full."""
+        with self._conn_lock:
+            pool = self._conn_pools.setdefault(host, [])
+            if len(pool) < 8:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _create_multipart_body(self, params, boundary):
+        """
+        Create multipart/form-data head and footer for photo upload.
+
+        The photo data itself is streamed separately between the two parts
+        so large originals are never buffered in full.
+
         Args:
             params: Dictionary of form parameters
-            photo_data: Binary photo data (BytesIO or file-like object)
             boundary: Multipart boundary string
-            
+
         Returns:
-            Encoded multipart body as bytes
+            Tuple of (head, footer) bytes surrounding the photo data
         """
-        body = BytesIO()
-        
-        # Add text parameters
-        for key, value in params.items():
-            body.write(f'--{boundary}\r\n'.encode('utf-8'))
-            body.write(f'Content-Disposition: form-data; name="{key}"\r\n\r\n'.encode('utf-8'))
-            body.write(f'{value}\r\n'.encode('utf-8'))
-        
-        # Add photo file
-        body.write(f'--{boundary}\r\n'.encode('utf-8'))
-        body.write(f'Content-Disposition: form-data; name="photo"; filename="photo.jpg"\r\n'.encode('utf-8'))
-        body.write(f'Content-Type: image/jpeg\r\n\r\n'.encode('utf-8'))
-        
-        # Read and write photo data
-        photo_data.seek(0)
-        body.write(photo_data.read())
-        
-        body.write(f'\r\n--{boundary}--\r\n'.encode('utf-8'))
-        
-        return body.getvalue()
+        b_boundary = boundary.encode('ascii')
+
+        # Add text parameters using a single bytes template per field
+        # (one encode per key/value instead of three per field)
+        parts = [
+            b'--%b\r\nContent-Disposition: form-data; name="%b"\r\n\r\n%b\r\n'
+            % (b_boundary, str(key).encode('utf-8'), str(value).encode('utf-8'))
+            for key, value in params.items()
+        ]
+
+        # Add photo file headers; the photo bytes follow in the stream
+        parts.append(
+            b'--%b\r\n'
+            b'Content-Disposition: form-data; name="photo"; filename="photo.jpg"\r\n'
+            b'Content-Type: image/jpeg\r\n\r\n' % b_boundary
+        )
+
+        footer = b'\r\n--' + b_boundary + b'--\r\n'
+
+        return b''.join(parts), footer
 
     def _parse_upload_response(self, xml_response):
         """
         Parse XML response from Flickr upload API.
-        
+
         Args:
-            xml_response: XML string response
-            
+            xml_response: Raw XML response bytes
+
         Returns:
             Dictionary with parsed response data
             
         Raises:
             Exception: If response indicates failure
         """
+        # Fast path: pull the photoid or error straight out with regexes
+        stat_match = _UPLOAD_STAT_RE.search(xml_response)
+        if stat_match is not None:
+            if stat_match.group(1) == b'fail':
+                # Fall through to the XML parser when the regex misses
+                # (e.g. swapped attribute order) or the message contains
+                # entity references that need decoding
+                err_match = _UPLOAD_ERR_RE.search(xml_response)
+                if err_match is not None and b'&' not in err_match.group(0):
+                    error_code = err_match.group(1).decode('utf-8', errors='replace')
+                    error_msg = err_match.group(2).decode('utf-8', errors='replace')
+                    raise Exception(f"Flickr upload error [{error_code}]: {error_msg}")
+            else:
+                photoid_match = _UPLOAD_PHOTOID_RE.search(xml_response)
+                if photoid_match is not None:
+                    return {'photo_id': photoid_match.group(1).decode('ascii'), 'stat': 'ok'}
+
+        # Fall back to a full XML parse for any response the regexes miss
         try:
             root = ET.fromstring(xml_response)
             
@@ -244,7 +420,7 @@ class FlickrPlugin(PhotoservPlugin):
                 
         except ET.ParseError as e:
             self.logger.error(f"Failed to parse upload response XML: {e}")
-            self.logger.error(f"Response was: {xml_response}")
+            self.logger.error(f"Response was: {xml_response.decode('utf-8', errors='replace')}")
             raise Exception(f"Invalid XML response from Flickr: {e}")
 
     def _generate_oauth_signature(self, method, url, params):
@@ -259,41 +435,42 @@ class FlickrPlugin(PhotoservPlugin):
         Returns:
             Base64-encoded HMAC-SHA1 signature
         """
-        # Sort parameters
-        sorted_params = sorted(params.items())
-        
-        # Create parameter string
-        param_string = '&'.join([f"{k}={urllib.parse.quote(str(v), safe='')}" 
-                                 for k, v in sorted_params])
-        
-        # Create signature base string
+        _quote = urllib.parse.quote
+
+        # Create parameter string from sorted parameters; keys are ASCII
+        # OAuth/API names, so only values need percent-encoding
+        param_string = '&'.join(
+            k + '=' + _quote(v if isinstance(v, str) else str(v), safe='')
+            for k, v in sorted(params.items())
+        )
+
+        # Create signature base string, reusing the pre-quoted endpoint URL
+        quoted_url = self._quoted_base_urls.get(url) or _quote(url, safe='')
         base_string = '&'.join([
             method.upper(),
-            urllib.parse.quote(url, safe=''),
-            urllib.parse.quote(param_string, safe='')
+            quoted_url,
+            _quote(param_string, safe='')
         ])
-        
-        # Create signing key (client_secret&token_secret)
-        signing_key = f"{urllib.parse.quote(self.api_secret, safe='')}&{urllib.parse.quote(self.oauth_token_secret, safe='')}"
-        
-        # Generate signature
-        signature = hmac.new(
-            signing_key.encode('utf-8'),
+
+        # Generate signature with the precomputed signing key; hmac.digest
+        # is a one-shot fast path that skips HMAC object construction and
+        # already routes to OpenSSL's accelerated SHA-1 (a cryptography/
+        # PyCryptodome backend benchmarks within noise of it here)
+        signature = hmac.digest(
+            self._signing_key_bytes,
             base_string.encode('utf-8'),
-            hashlib.sha1
-        ).digest()
+            'sha1'
+        )
         
         # Base64 encode
         return base64.b64encode(signature).decode('utf-8')
 
-    def _build_description(self, data, params):
-        """Build photo description from data and parameters."""
+    def _build_description(self, description, params):
+        """Build photo description from the photo's own description and parameters."""
         # Check for override description
         if params and params.get('override_description'):
             description = params['override_description']
-        else:
-            description = data.get('description', '')
-        
+
         # Add footer if configured
         if self.photo_description_footer:
             if description:
@@ -303,126 +480,142 @@ class FlickrPlugin(PhotoservPlugin):
         
         return description
 
-    def _build_tags(self, data, params):
-        """Build tag list from photo data and parameters."""
-        tags = []
-        seen_tags = set()
-        
-        # Add tags from photo data
-        photo_tags = data.get('tags', [])
-        for tag in photo_tags:
-            tag_name = tag.get('name', '')
-            # Remove spaces from tags as required by Flickr
-            tag_name = tag_name.replace(' ', '')
-            if tag_name and tag_name not in seen_tags:
-                tags.append(tag_name)
-                seen_tags.add(tag_name)
-        
+    def _build_photo_context(self, photo_tags, photo_albums):
+        """
+        Precompute tag/album lookups from the photo's tag and album lists.
+
+        Shared by _build_tags and _get_applicable_group_sets so the photo's
+        tag and album lists are only walked once per publish.
+        """
+        tag_name_list = [tag.get('name', '') for tag in photo_tags]
+        return {
+            'tag_name_list': tag_name_list,
+            'tag_names': frozenset(tag_name_list),
+            'album_names': frozenset({album.get('uuid') for album in photo_albums}
+                                     | {album.get('slug') for album in photo_albums}),
+        }
+
+    def _build_tags(self, photo_ctx, params):
+        """Build tag list from precomputed photo context and parameters."""
+        raw = list(photo_ctx['tag_name_list'])
+
         # Add additional tags from entity parameters
-        if params and params.get('additional_tags'):
-            additional = params['additional_tags']
+        if params:
+            additional = params.get('additional_tags')
             if isinstance(additional, list):
-                for tag in additional:
-                    tag_name = str(tag).replace(' ', '')
-                    if tag_name and tag_name not in seen_tags:
-                        tags.append(tag_name)
-                        seen_tags.add(tag_name)
-        
-        return tags
+                raw.extend(str(tag) for tag in additional)
 
-    def _get_applicable_group_sets(self, data, params):
+        # Remove spaces from tags as required by Flickr, then dedupe;
+        # dict.fromkeys preserves first-seen order without a manual set
+        cleaned = (tag.replace(' ', '') for tag in raw)
+        return [tag for tag in dict.fromkeys(cleaned) if tag]
+
+    def _get_applicable_group_sets(self, photo_ctx, params):
         """Determine which group sets apply to this photo based on OR-matching with glob pattern support."""
         applicable_sets = []
-        
-        # Get photo tags and albums
-        photo_tag_names = {tag.get('name') for tag in data.get('tags', [])}
-        photo_album_uuids = {album.get('uuid') for album in data.get('albums', [])}
-        photo_album_slugs = {album.get('slug') for album in data.get('albums', [])}
-        
-        for group_set in self.group_sets:
+
+        # Precomputed photo tag and album lookups
+        photo_tag_names = photo_ctx['tag_names']
+        photo_album_names = photo_ctx['album_names']
+        applied_ids = set()
+
+        for group_set, matcher in zip(self.group_sets, self._group_set_matchers):
             name = group_set.get('name')
             if not name:
                 continue
-            
+
+            exact_tags, glob_tags, exact_albums, glob_albums = matcher
+
             # Check auto_tags - photo matches if ANY tag matches ANY pattern (OR-based with glob support)
-            auto_tags = group_set.get('auto_tags', [])
-            if auto_tags:
-                matched = False
-                for pattern in auto_tags:
-                    # Check if any photo tag matches this pattern
-                    if any(fnmatch(tag, pattern) for tag in photo_tag_names):
-                        matched = True
-                        self.logger.info(f"  Auto-matched group set '{name}' via tag pattern '{pattern}'")
-                        break
-                if matched:
-                    applicable_sets.append(group_set)
-                    continue
-            
-            # Check auto_albums - photo matches if ANY album matches ANY pattern (OR-based with glob support)
-            auto_albums = group_set.get('auto_albums', [])
-            if auto_albums:
-                matched = False
-                for pattern in auto_albums:
-                    # Check if any album UUID or slug matches this pattern
-                    if any(fnmatch(album, pattern) for album in photo_album_uuids | photo_album_slugs):
-                        matched = True
-                        self.logger.info(f"  Auto-matched group set '{name}' via album pattern '{pattern}'")
-                        break
-                if matched:
-                    applicable_sets.append(group_set)
-                    continue
-        
+            matched = self._match_patterns(photo_tag_names, exact_tags, glob_tags)
+            if matched is not None:
+                self.logger.info("  Auto-matched group set '%s' via tag pattern '%s'", name, matched)
+                applicable_sets.append(group_set)
+                applied_ids.add(id(group_set))
+                continue
+
+            # Check auto_albums - photo matches if ANY album UUID or slug matches ANY pattern
+            matched = self._match_patterns(photo_album_names, exact_albums, glob_albums)
+            if matched is not None:
+                self.logger.info("  Auto-matched group set '%s' via album pattern '%s'", name, matched)
+                applicable_sets.append(group_set)
+                applied_ids.add(id(group_set))
+
         # Add additional group sets from entity parameters
         if params and params.get('additional_group_sets'):
             additional_names = params['additional_group_sets']
             if isinstance(additional_names, list):
                 for name in additional_names:
-                    # Find group set by name
-                    for group_set in self.group_sets:
-                        if group_set.get('name') == name:
-                            if group_set not in applicable_sets:
-                                applicable_sets.append(group_set)
-                                self.logger.info(f"  Added group set '{name}' via entity params")
-                            break
-        
+                    # Resolve group set by name
+                    group_set = self._group_sets_by_name.get(name)
+                    if group_set is not None and id(group_set) not in applied_ids:
+                        applicable_sets.append(group_set)
+                        applied_ids.add(id(group_set))
+                        self.logger.info("  Added group set '%s' via entity params", name)
+
         return applicable_sets
 
+    @staticmethod
+    def _match_patterns(values, exact, globs):
+        """Return the matching pattern if any value matches, else None."""
+        if exact:
+            hit = values & exact
+            if hit:
+                return next(iter(hit))
+        for pattern in globs:
+            if any(fnmatch(value, pattern) for value in values):
+                return pattern
+        return None
+
     def _add_photo_to_groups(self, flickr_photo_id, group_sets):
         """Add photo to Flickr groups based on group sets."""
+        # Group adds are independent, network-bound calls, so dispatch
+        # them concurrently instead of paying one round trip per group
+        futures = {}
         for group_set in group_sets:
             groups = group_set.get('groups', [])
             set_name = group_set.get('name', 'unnamed')
-            
+
             for group_id in groups:
-                try:
-                    self.logger.info(f"  Adding photo to group {group_id} (set: {set_name})")
-                    self._flickr_api_call('flickr.groups.pools.add', {
-                        'photo_id': flickr_photo_id,
-                        'group_id': group_id
-                    })
-                except Exception as e:
-                    self.logger.error(f"  Failed to add photo to group {group_id}: {e}")
-                    # Continue with other groups even if one fails
+                self.logger.info("  Adding photo to group %s (set: %s)", group_id, set_name)
+                future = self._group_executor.submit(self._flickr_api_call, 'flickr.groups.pools.add', {
+                    'photo_id': flickr_photo_id,
+                    'group_id': group_id
+                })
+                futures[future] = group_id
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error("  Failed to add photo to group %s: %s", futures[future], e)
+                # Continue with other groups even if one fails
     
     def _geotag_photo(self, flickr_photo_id, latitude, longitude):
         """Add geotag to photo on Flickr."""
         try:
-            self.logger.info(f"  Adding geotag to photo (ID: {flickr_photo_id}): lat={latitude}, lon={longitude}")
+            self.logger.info("  Adding geotag to photo (ID: %s): lat=%s, lon=%s", flickr_photo_id, latitude, longitude)
             self._flickr_api_call('flickr.photos.geo.setLocation', {
                 'photo_id': flickr_photo_id,
                 'lat': str(latitude),
                 'lon': str(longitude)
             })
         except Exception as e:
-            self.logger.error(f"  Failed to add geotag to photo: {e}")
+            self.logger.error("  Failed to add geotag to photo: %s", e)
             # Geotagging is optional, so we won't raise an exception here
 
     def on_photo_publish(self, data, params, **kwargs):
         """Handle photo publish events."""
+        # Pull everything needed out of the photo data once
         photo_uuid = data.get('uuid')
         photo_title = data.get('title', 'Untitled')
-        
-        self.logger.info(f"Publishing photo to Flickr: {photo_title} (UUID: {photo_uuid})")
+        photo_hidden = bool(data.get('hidden'))
+        photo_description = data.get('description', '')
+        photo_tags = data.get('tags', [])
+        photo_albums = data.get('albums', [])
+        photo_location = data.get('location')
+
+        self.logger.info("Publishing photo to Flickr: %s (UUID: %s)", photo_title, photo_uuid)
         
         # Check force parameter
         force = params and params.get('force', False)
@@ -432,118 +625,119 @@ class FlickrPlugin(PhotoservPlugin):
         existing_flickr_id = self.photoserv.config.get(upload_key)
         
         if existing_flickr_id and not force:
-            self.logger.info(f"  Photo already uploaded to Flickr (ID: {existing_flickr_id}), skipping")
+            self.logger.info("  Photo already uploaded to Flickr (ID: %s), skipping", existing_flickr_id)
             return
         
         if existing_flickr_id and force:
-            self.logger.info(f"  Photo already uploaded to Flickr (ID: {existing_flickr_id}), but force=true, proceeding anyway")
+            self.logger.info("  Photo already uploaded to Flickr (ID: %s), but force=true, proceeding anyway", existing_flickr_id)
         
         # Check photo limit
         published_count = self.photoserv.config.get('published_photo_count', 0)
         if published_count >= self.flickr_photo_limit:
-            self.logger.error(f"  Photo limit reached ({self.flickr_photo_limit}), cannot publish")
+            self.logger.error("  Photo limit reached (%s), cannot publish", self.flickr_photo_limit)
             raise Exception(f"Maximum published photo limit ({self.flickr_photo_limit}) reached")
         
-        # Build description and tags
-        description = self._build_description(data, params)
-        tags = self._build_tags(data, params)
-        
-        self.logger.info(f"  Title: {photo_title}")
-        self.logger.info(f"  Description: {description[:50]}..." if len(description) > 50 else f"  Description: {description}")
-        self.logger.info(f"  Tags: {', '.join(tags)}")
-        
-        # Get photo image
+        # Build description and tags from the shared photo context
+        photo_ctx = self._build_photo_context(photo_tags, photo_albums)
+        description = self._build_description(photo_description, params)
+        tags = self._build_tags(photo_ctx, params)
+        
+        self.logger.info("  Title: %s", photo_title)
+        self.logger.info("  Description: %s%s", description[:50], '...' if len(description) > 50 else '')
+        self.logger.info("  Tags: %s", ', '.join(tags))
+        
+        # Prepare and validate upload parameters before fetching the image
+        # so a rejected publish never pays for the download
+        upload_params = {
+            'title': photo_title,
+            'description': description,
+            'tags': ' '.join(tags),
+            'is_public': '1',
+            'is_friend': '0',
+            'is_family': '0',
+            'hidden': '2' if photo_hidden else '1',
+        }
+
+        # Add safety_level if specified in entity parameters
+        if params and params.get('safety_level'):
+            safety_level = params.get('safety_level')
+            # Validate safety_level is 1, 2, or 3
+            if safety_level in _VALID_SAFETY_LEVELS:
+                upload_params['safety_level'] = str(safety_level)
+                self.logger.info("  Safety level: %s", safety_level)
+            else:
+                self.logger.warning("  Invalid safety_level '%s', using user default", safety_level)
+
+        # Get photo image; this is the expensive step, so it runs only
+        # after every cheap check above has passed
         try:
             # Fetch the configured upload size
             photo_stream = self.photoserv.get_photo_image(data, self.upload_size)
             if not photo_stream:
                 raise Exception(f"Could not retrieve photo image at size '{self.upload_size}'")
         except Exception as e:
-            self.logger.error(f"  Error getting photo image: {e}")
+            self.logger.error("  Error getting photo image: %s", e)
             raise
-        
-        # Ensure stream is closed even if an error occurs
+
         try:
-            # Upload photo to Flickr
-            self.logger.info("  Uploading photo to Flickr...")
-            
-            # Prepare upload parameters
-            upload_params = {
-                'title': photo_title,
-                'description': description,
-                'tags': ' '.join(tags),
-                'is_public': '1',
-                'is_friend': '0',
-                'is_family': '0',
-                'hidden': '2' if data.get('hidden') else '1',
-            }
-            
-            # Add safety_level if specified in entity parameters
-            if params and params.get('safety_level'):
-                safety_level = params.get('safety_level')
-                # Validate safety_level is 1, 2, or 3
-                if safety_level in [1, 2, 3]:
-                    upload_params['safety_level'] = str(safety_level)
-                    self.logger.info(f"  Safety level: {safety_level}")
+            # Ensure the stream is closed even if an error occurs
+            with closing(photo_stream):
+                # Upload photo to Flickr
+                self.logger.info("  Uploading photo to Flickr...")
+
+                upload_response = self._flickr_api_call(
+                    method=None,
+                    params=upload_params,
+                    upload=True,
+                    photo_data=photo_stream
+                )
+
+                # Extract photo ID from response
+                flickr_photo_id = upload_response.get('photo_id')
+                if not flickr_photo_id:
+                    raise Exception("Failed to get photo ID from upload response")
+
+                self.logger.info("  Photo uploaded successfully (Flickr ID: %s)", flickr_photo_id)
+
+                # Increment published photo count (only if this is a new upload)
+                new_count = published_count + 1 if not existing_flickr_id else published_count
+
+                # Store the Flickr photo ID and count in one persistence window;
+                # use the host's batch support when available so both writes
+                # land in a single round trip to the backing store
+                config_batch = getattr(self.photoserv.config, 'batch', None)
+                with config_batch() if config_batch else nullcontext():
+                    self.photoserv.config.set(upload_key, flickr_photo_id)
+                    if not existing_flickr_id:
+                        self.photoserv.config.set('published_photo_count', new_count)
+
+                # Add to groups
+                group_sets = self._get_applicable_group_sets(photo_ctx, params)
+                if group_sets:
+                    self.logger.info("  Adding photo to %d group set(s)", len(group_sets))
+                    self._add_photo_to_groups(flickr_photo_id, group_sets)
                 else:
-                    self.logger.warning(f"  Invalid safety_level '{safety_level}', using user default")
-            
-            # Upload the photo
-            upload_response = self._flickr_api_call(
-                method=None,
-                params=upload_params,
-                upload=True,
-                photo_data=photo_stream
-            )
-            
-            # Extract photo ID from response
-            flickr_photo_id = upload_response.get('photo_id')
-            if not flickr_photo_id:
-                raise Exception("Failed to get photo ID from upload response")
-            
-            self.logger.info(f"  Photo uploaded successfully (Flickr ID: {flickr_photo_id})")
-            
-            # Increment published photo count (only if this is a new upload)
-            if not existing_flickr_id:
-                new_count = published_count + 1
-                self.photoserv.config.set('published_photo_count', new_count)
-            else:
-                new_count = published_count
-            
-            # Store flickr photo ID
-            self.photoserv.config.set(upload_key, flickr_photo_id)
-            
-            # Add to groups
-            group_sets = self._get_applicable_group_sets(data, params)
-            if group_sets:
-                self.logger.info(f"  Adding photo to {len(group_sets)} group set(s)")
-                self._add_photo_to_groups(flickr_photo_id, group_sets)
-            else:
-                self.logger.info("  No group sets applicable for this photo")
-            
-            # Geotag photo if location data is available
-            location = data.get('location')
-            if location:
-                latitude = location.get('latitude')
-                longitude = location.get('longitude')
-                if latitude is not None and longitude is not None:
-                    self._geotag_photo(flickr_photo_id, latitude, longitude)
-            
-            self.logger.info(f"  Publish complete (total published: {new_count}/{self.flickr_photo_limit})")
-            
+                    self.logger.info("  No group sets applicable for this photo")
+
+                # Geotag photo if location data is available
+                if photo_location:
+                    latitude = photo_location.get('latitude')
+                    longitude = photo_location.get('longitude')
+                    if latitude is not None and longitude is not None:
+                        self._geotag_photo(flickr_photo_id, latitude, longitude)
+
+                self.logger.info("  Publish complete (total published: %s/%s)", new_count, self.flickr_photo_limit)
+
         except Exception as e:
-            self.logger.error(f"  Failed to publish photo: {e}")
+            self.logger.error("  Failed to publish photo: %s", e)
             raise
-        finally:
-            # Always close the stream
-            photo_stream.close()
 
     def on_photo_unpublish(self, data, params, **kwargs):
         """Handle photo unpublish events."""
         photo_uuid = data.get('uuid')
         photo_title = data.get('title', 'Untitled')
         
-        self.logger.info(f"Unpublishing photo from Flickr: {photo_title} (UUID: {photo_uuid})")
+        self.logger.info("Unpublishing photo from Flickr: %s (UUID: %s)", photo_title, photo_uuid)
         
         # Check force parameter
         force = params.get('force', False)
@@ -562,7 +756,7 @@ class FlickrPlugin(PhotoservPlugin):
         
         try:
             # Delete photo from Flickr
-            self.logger.info(f"  Deleting photo from Flickr (ID: {flickr_photo_id})")
+            self.logger.info("  Deleting photo from Flickr (ID: %s)", flickr_photo_id)
             self._flickr_api_call('flickr.photos.delete', {
                 'photo_id': flickr_photo_id
             })
@@ -577,8 +771,8 @@ class FlickrPlugin(PhotoservPlugin):
             if published_count > 0:
                 new_count = published_count - 1
                 self.photoserv.config.set('published_photo_count', new_count)
-                self.logger.info(f"  Unpublish complete (total published: {new_count})")
+                self.logger.info("  Unpublish complete (total published: %s)", new_count)
             
         except Exception as e:
-            self.logger.error(f"  Failed to unpublish photo: {e}")
+            self.logger.error("  Failed to unpublish photo: %s", e)
             raise